@@ -0,0 +1,133 @@
+"""
+Compares per-query latency and CPU of the hot reads on the Prisma path and on the
+asyncpg fast-read path.
+
+Usage (needs a reachable DATABASE_URL, a generated Prisma client and asyncpg):
+
+    python -m benchmarks.read_paths --iterations 2000
+
+Latency is wall-clock time per awaited query. CPU is the time spent by this Python
+process per query; when psutil is installed, the CPU of child processes (the Prisma
+query engine) is reported as well, since the Prisma path does part of its work there.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import asyncpg
+import prisma.models
+import project.fast_read_service
+from prisma import Prisma
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def child_cpu_time() -> float:
+    """
+    Returns the CPU time used so far by child processes, or 0.0 without psutil.
+    """
+    if psutil is None:
+        return 0.0
+    total = 0.0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            times = child.cpu_times()
+        except psutil.NoSuchProcess:
+            continue
+        total += times.user + times.system
+    return total
+
+
+async def measure(
+    query: Callable[[], Awaitable[object]], iterations: int, warmup: int
+) -> Dict[str, float]:
+    """
+    Runs a query `iterations` times after `warmup` untimed runs.
+
+    Returns:
+        Dict[str, float]: Latency percentiles in microseconds and CPU per query.
+    """
+    for _ in range(warmup):
+        await query()
+    latencies: List[float] = []
+    cpu_start = time.process_time()
+    child_start = child_cpu_time()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await query()
+        latencies.append((time.perf_counter() - start) * 1e6)
+    cpu = (time.process_time() - cpu_start) / iterations * 1e6
+    child_cpu = (child_cpu_time() - child_start) / iterations * 1e6
+    latencies.sort()
+    return {
+        "mean": statistics.fmean(latencies),
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "cpu": cpu,
+        "child_cpu": child_cpu,
+    }
+
+
+async def main(iterations: int, warmup: int, user_id: int) -> None:
+    db_client = Prisma(auto_register=True)
+    await db_client.connect()
+    dsn, options = project.fast_read_service.asyncpg_connect_args(
+        os.environ["DATABASE_URL"]
+    )
+    pool = await asyncpg.create_pool(dsn, min_size=1, max_size=1, **options)
+    queries = {
+        "role lookup": (
+            lambda: prisma.models.User.prisma().find_unique(where={"id": user_id}),
+            lambda: pool.fetchval(project.fast_read_service.ROLE_QUERY, user_id),
+        ),
+        "message read": (
+            lambda: prisma.models.HelloWorldModule.prisma().find_first(),
+            lambda: pool.fetchrow(project.fast_read_service.HELLO_WORLD_MESSAGE_QUERY),
+        ),
+        "documentation read": (
+            lambda: prisma.models.APIDocumentation.prisma().find_first(),
+            lambda: pool.fetchrow(project.fast_read_service.API_DOCUMENTATION_QUERY),
+        ),
+    }
+    header = (
+        f"{'query':<20} {'backend':<8} {'mean us':>10} {'p50 us':>10} "
+        f"{'p99 us':>10} {'cpu us':>10}"
+    )
+    if psutil is not None:
+        header += f" {'engine us':>10}"
+    print(header)
+    try:
+        for name, (prisma_query, asyncpg_query) in queries.items():
+            for backend, query in (
+                ("prisma", prisma_query),
+                ("asyncpg", asyncpg_query),
+            ):
+                result = await measure(query, iterations, warmup)
+                line = (
+                    f"{name:<20} {backend:<8} {result['mean']:>10.1f} "
+                    f"{result['p50']:>10.1f} {result['p99']:>10.1f} {result['cpu']:>10.1f}"
+                )
+                if psutil is not None:
+                    line += f" {result['child_cpu']:>10.1f}"
+                print(line)
+    finally:
+        await pool.close()
+        await db_client.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare hot-read latency and CPU of Prisma and asyncpg."
+    )
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--user-id", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.warmup, args.user_id))
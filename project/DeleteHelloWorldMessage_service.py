@@ -2,6 +2,7 @@ from typing import Optional
 
 import prisma
 import prisma.models
+import project.fast_read_service
 from pydantic import BaseModel
 
 
@@ -35,6 +36,8 @@ async def get_current_user_role(user_id: int) -> Optional[str]:
         role = await get_current_user_role(5)
         > "Admin"
     """
+    if project.fast_read_service.is_enabled():
+        return await project.fast_read_service.fetch_user_role(user_id)
     user = await prisma.models.User.prisma().find_unique(where={"id": user_id})
     return user.role.name if user else None
 
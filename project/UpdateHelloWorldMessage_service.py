@@ -1,5 +1,6 @@
 import prisma
 import prisma.models
+import project.fast_read_service
 from pydantic import BaseModel
 
 
@@ -30,10 +31,15 @@ async def UpdateHelloWorldMessage(message: str) -> UpdateHelloWorldMessageRespon
     print(updated_message.message)  # Output: "New Hello World Message"
     print(updated_message.status)  # Output: "updated" or "created"
     """
-    hello_world_entry = await prisma.models.HelloWorldModule.prisma().find_first()
-    if hello_world_entry:
+    if project.fast_read_service.is_enabled():
+        row = await project.fast_read_service.fetch_hello_world_message()
+        hello_world_id = row["id"] if row else None
+    else:
+        hello_world_entry = await prisma.models.HelloWorldModule.prisma().find_first()
+        hello_world_id = hello_world_entry.id if hello_world_entry else None
+    if hello_world_id is not None:
         await prisma.models.HelloWorldModule.prisma().update(
-            where={"id": hello_world_entry.id}, data={"description": message}
+            where={"id": hello_world_id}, data={"description": message}
         )
         return UpdateHelloWorldMessageResponse(message=message, status="updated")
     else:
@@ -2,6 +2,7 @@ from datetime import datetime
 
 import prisma
 import prisma.models
+import project.fast_read_service
 from fastapi import HTTPException, status
 from pydantic import BaseModel
 
@@ -42,6 +43,8 @@ async def verify_administrator_role(user_id: int) -> bool:
         verify_administrator_role(1)
         > True
     """
+    if project.fast_read_service.is_enabled():
+        return await project.fast_read_service.fetch_user_role(user_id) == "Admin"
     user = await prisma.models.User.prisma().find_first(where={"id": user_id})
     if user and user.role == "Admin":
         return True
@@ -72,6 +75,14 @@ async def api_documentation(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this resource.",
         )
+    if project.fast_read_service.is_enabled():
+        row = await project.fast_read_service.fetch_api_documentation()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="API documentation not found.",
+            )
+        return APIDocumentationResponse(**dict(row))
     documentation = await prisma.models.APIDocumentation.prisma().find_first()
     if not documentation:
         raise HTTPException(
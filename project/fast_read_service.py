@@ -0,0 +1,201 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import asyncpg
+except ImportError:  # asyncpg is optional, Prisma is used for every query without it
+    asyncpg = None
+
+FAST_READ_BACKEND_ENV = "FAST_READ_BACKEND"
+
+ROLE_QUERY = 'SELECT "role" FROM "User" WHERE "id" = $1'
+HELLO_WORLD_MESSAGE_QUERY = (
+    'SELECT "id", "description" FROM "HelloWorldModule" ORDER BY "id" LIMIT 1'
+)
+
+# Prisma stores DateTime as UTC in `timestamp(3)` columns and returns aware datetimes;
+# AT TIME ZONE 'UTC' makes asyncpg return the same aware values.
+API_DOCUMENTATION_QUERY = (
+    'SELECT "id", "title", "description", '
+    '"createdAt" AT TIME ZONE \'UTC\' AS "createdAt", '
+    '"updatedAt" AT TIME ZONE \'UTC\' AS "updatedAt" '
+    'FROM "APIDocumentation" ORDER BY "id" LIMIT 1'
+)
+
+# Connection string parameters understood by the Prisma engine but not by asyncpg.
+PRISMA_ONLY_PARAMS = {
+    "schema",
+    "connection_limit",
+    "pool_timeout",
+    "pgbouncer",
+    "socket_timeout",
+    "statement_cache_size",
+    "connect_timeout",
+    "sslaccept",
+    "sslidentity",
+    "sslpassword",
+}
+
+_pool: Optional["asyncpg.Pool"] = None
+
+
+def is_enabled() -> bool:
+    """
+    Tells whether hot reads should go through the asyncpg pool instead of Prisma.
+
+    Returns:
+        bool: True once connect() has opened the pool.
+    """
+    return _pool is not None
+
+
+def get_pool() -> Optional["asyncpg.Pool"]:
+    """
+    Returns the asyncpg pool, or None if the fast-read backend is disabled.
+    """
+    return _pool
+
+
+def asyncpg_connect_args(database_url: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Converts a Prisma DATABASE_URL into a DSN and pool options asyncpg accepts.
+
+    asyncpg forwards unknown query parameters to the server as settings, so the
+    Prisma-only ones are dropped. The Prisma `schema` parameter becomes the search_path,
+    `pgbouncer=true` turns off asyncpg's statement cache, since named prepared
+    statements do not survive PgBouncer's transaction pooling, and a `host` parameter
+    is passed on as the host to connect to.
+
+    Args:
+        database_url (str): The Prisma connection string.
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: The asyncpg DSN and the keyword arguments for asyncpg.create_pool().
+
+    Example:
+        asyncpg_connect_args("postgresql://u:p@localhost:5432/db?schema=public")
+        > ("postgresql://u:p@localhost:5432/db", {"server_settings": {"search_path": "public"}})
+    """
+    parts = urlsplit(database_url)
+    params = dict(parse_qsl(parts.query))
+    options: Dict[str, Any] = {}
+    if params.get("schema"):
+        options["server_settings"] = {"search_path": params["schema"]}
+    if params.get("pgbouncer", "").lower() == "true":
+        options["statement_cache_size"] = 0
+    if params.get("host"):
+        # Prisma lets `?host=` (e.g. a Cloud SQL socket directory) override the host in
+        # the URL, while asyncpg prefers the URL's host; an explicit argument wins there.
+        options["host"] = params.pop("host")
+    query = urlencode({k: v for k, v in params.items() if k not in PRISMA_ONLY_PARAMS})
+    return urlunsplit(parts._replace(query=query)), options
+
+
+async def warm_connection(connection: "asyncpg.Connection") -> None:
+    """
+    Runs every hot query once on a new pooled connection.
+
+    asyncpg prepares a query on its first run and keeps it in the connection's
+    statement cache (unless the cache is off behind PgBouncer), so later calls skip
+    parsing and planning. The pool calls this for every connection it opens, including
+    those opened above min_size later on. User 0 never exists, so the role lookup
+    matches nothing.
+
+    Args:
+        connection (asyncpg.Connection): The connection the pool has just opened.
+    """
+    await connection.fetchval(ROLE_QUERY, 0)
+    await connection.fetchrow(HELLO_WORLD_MESSAGE_QUERY)
+    await connection.fetchrow(API_DOCUMENTATION_QUERY)
+
+
+async def connect(
+    database_url: Optional[str] = None, min_size: int = 2, max_size: int = 10
+) -> bool:
+    """
+    Opens the asyncpg pool if the fast-read backend is enabled with FAST_READ_BACKEND=asyncpg.
+
+    The min_size connections are opened and warmed with the hot queries before it returns.
+
+    Args:
+        database_url (Optional[str]): The connection string, defaults to DATABASE_URL.
+        min_size (int): The number of connections opened up front.
+        max_size (int): The maximum number of pooled connections.
+
+    Returns:
+        bool: True if the pool was opened, False if the backend is disabled.
+
+    Example:
+        await connect()
+        > True
+    """
+    global _pool
+    if os.environ.get(FAST_READ_BACKEND_ENV, "").lower() != "asyncpg":
+        return False
+    if asyncpg is None:
+        raise RuntimeError(
+            f"{FAST_READ_BACKEND_ENV}=asyncpg is set but asyncpg is not installed."
+        )
+    dsn, options = asyncpg_connect_args(database_url or os.environ["DATABASE_URL"])
+    _pool = await asyncpg.create_pool(
+        dsn, min_size=min_size, max_size=max_size, init=warm_connection, **options
+    )
+    return True
+
+
+async def disconnect() -> None:
+    """
+    Closes the asyncpg pool, if it is open.
+    """
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def fetch_user_role(user_id: int) -> Optional[str]:
+    """
+    Reads a user's role with a single prepared statement.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        Optional[str]: The role of the user (Admin or User) or None if the user is not found.
+
+    Example:
+        await fetch_user_role(5)
+        > "Admin"
+    """
+    return await _pool.fetchval(ROLE_QUERY, user_id)
+
+
+async def fetch_hello_world_message() -> Optional["asyncpg.Record"]:
+    """
+    Reads the current 'hello world' message with a single prepared statement.
+
+    Returns:
+        Optional[asyncpg.Record]: A row with `id` and `description`, or None if there is no message.
+
+    Example:
+        row = await fetch_hello_world_message()
+        row["description"]
+        > "Hello, World!"
+    """
+    return await _pool.fetchrow(HELLO_WORLD_MESSAGE_QUERY)
+
+
+async def fetch_api_documentation() -> Optional["asyncpg.Record"]:
+    """
+    Reads the API documentation entry with a single prepared statement.
+
+    Returns:
+        Optional[asyncpg.Record]: A row with `id`, `title`, `description`, `createdAt` and `updatedAt`, or None.
+
+    Example:
+        row = await fetch_api_documentation()
+        row["title"]
+        > "Hello World API"
+    """
+    return await _pool.fetchrow(API_DOCUMENTATION_QUERY)
@@ -0,0 +1,277 @@
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from datetime import datetime, timezone
+from types import FrameType
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import prisma
+import prisma.models
+import project.fast_read_service
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+PING_TIMEOUT_SECONDS = 2.0
+
+# How long /readyz keeps answering 503 after SIGTERM before the server starts shutting
+# down. It should exceed the orchestrator's readiness probe period, so the worker is
+# out of rotation before it stops accepting connections.
+DRAIN_DELAY_SECONDS = float(os.environ.get("DRAIN_DELAY_SECONDS", "5"))
+
+_ready = False
+_draining = False
+_prewarm_lock = asyncio.Lock()
+_last_ping_latency_ms: Optional[float] = None
+_last_ping_at: Optional[datetime] = None
+
+
+class PoolStats(BaseModel):
+    """
+    Connection statistics of one database pool: the Prisma query engine pool, or the
+    asyncpg fast-read pool when it is enabled.
+    """
+
+    backend: str
+    size: int
+    in_use: int
+    idle: int
+    max_size: int
+
+
+class HealthResponse(BaseModel):
+    """
+    Response model for the liveness and readiness endpoints.
+    """
+
+    status: str
+    ready: bool
+    pools: List[PoolStats]
+    last_ping_latency_ms: Optional[float] = None
+    last_ping_at: Optional[datetime] = None
+
+
+def prisma_connection_limit() -> int:
+    """
+    Returns the size limit of the Prisma query engine pool.
+
+    This is the `connection_limit` parameter of DATABASE_URL, or Prisma's default of
+    twice the number of CPUs plus one.
+
+    Returns:
+        int: The maximum number of connections the query engine opens.
+
+    Example:
+        prisma_connection_limit()
+        > 9
+    """
+    params = dict(parse_qsl(urlsplit(os.environ.get("DATABASE_URL", "")).query))
+    if params.get("connection_limit"):
+        return int(params["connection_limit"])
+    return (os.cpu_count() or 1) * 2 + 1
+
+
+async def get_pool_stats() -> List[PoolStats]:
+    """
+    Returns the in-use and idle connection counts of the database pools.
+
+    The Prisma counts come from the query engine metrics, so this does not touch the
+    database. It never raises: if the metrics cannot be read, the Prisma entry is left out.
+
+    Returns:
+        List[PoolStats]: The Prisma pool, followed by the asyncpg pool if it is enabled.
+
+    Example:
+        await get_pool_stats()
+        > [PoolStats(backend="prisma", size=9, in_use=1, idle=8, max_size=9)]
+    """
+    stats: List[PoolStats] = []
+    try:
+        metrics = await asyncio.wait_for(
+            prisma.get_client().get_metrics(), PING_TIMEOUT_SECONDS
+        )
+        gauges = {gauge.key: int(gauge.value) for gauge in metrics.gauges}
+        stats.append(
+            PoolStats(
+                backend="prisma",
+                size=gauges.get("prisma_pool_connections_open", 0),
+                in_use=gauges.get("prisma_pool_connections_busy", 0),
+                idle=gauges.get("prisma_pool_connections_idle", 0),
+                max_size=prisma_connection_limit(),
+            )
+        )
+    except Exception:
+        logger.exception("Could not read the Prisma query engine metrics")
+    pool = project.fast_read_service.get_pool()
+    if pool is not None:
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        stats.append(
+            PoolStats(
+                backend="asyncpg",
+                size=size,
+                in_use=size - idle,
+                idle=idle,
+                max_size=pool.get_max_size(),
+            )
+        )
+    return stats
+
+
+async def ping_database() -> float:
+    """
+    Runs `SELECT 1` against the database and records its latency.
+
+    Returns:
+        float: The round-trip latency in milliseconds.
+
+    Example:
+        await ping_database()
+        > 0.42
+    """
+    global _last_ping_latency_ms, _last_ping_at
+    pool = project.fast_read_service.get_pool()
+    start = time.perf_counter()
+    if pool is not None:
+        await asyncio.wait_for(pool.fetchval("SELECT 1"), PING_TIMEOUT_SECONDS)
+    else:
+        await asyncio.wait_for(
+            prisma.get_client().query_raw("SELECT 1"), PING_TIMEOUT_SECONDS
+        )
+    _last_ping_latency_ms = (time.perf_counter() - start) * 1000
+    _last_ping_at = datetime.now(timezone.utc)
+    return _last_ping_latency_ms
+
+
+async def _prewarm_prisma_queries() -> None:
+    """
+    Runs every hot query once through the Prisma query engine.
+    """
+    await prisma.models.User.prisma().find_unique(where={"id": 0})
+    await prisma.models.HelloWorldModule.prisma().find_first()
+    await prisma.models.APIDocumentation.prisma().find_first()
+
+
+async def prewarm() -> None:
+    """
+    Prewarms the Prisma pool and marks the worker as ready.
+
+    The hot queries run through Prisma once per connection the query engine may open,
+    all at the same time, so the engine opens and warms its whole pool instead of a
+    single connection. The asyncpg pool needs nothing here: it warms every connection
+    it opens (see project.fast_read_service.warm_connection).
+
+    Only one prewarm runs at a time; readiness() answers 503 while one is in flight.
+
+    Example:
+        await prewarm()
+    """
+    global _ready
+    async with _prewarm_lock:
+        await asyncio.gather(
+            *(_prewarm_prisma_queries() for _ in range(prisma_connection_limit()))
+        )
+        await ping_database()
+        _ready = True
+
+
+def start_draining() -> None:
+    """
+    Marks the worker as not ready for good, so it is taken out of rotation before it
+    shuts down.
+    """
+    global _ready, _draining
+    _ready = False
+    _draining = True
+
+
+def install_drain_handler() -> None:
+    """
+    Wraps the server's SIGTERM handler so that SIGTERM first makes /readyz fail and
+    only hands over to the server's shutdown after DRAIN_DELAY_SECONDS. A second
+    SIGTERM shuts down immediately.
+
+    It must run after the server has installed its own handler (uvicorn does so before
+    the lifespan startup) and does nothing if there is no handler to wrap.
+
+    Example:
+        install_drain_handler()
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    server_handler = signal.getsignal(signal.SIGTERM)
+    if not callable(server_handler):
+        return
+    loop = asyncio.get_running_loop()
+
+    def handle_sigterm(signum: int, frame: Optional[FrameType]) -> None:
+        if _draining:
+            server_handler(signum, frame)
+            return
+        start_draining()
+        logger.info("SIGTERM received, draining for %s s", DRAIN_DELAY_SECONDS)
+        loop.call_soon_threadsafe(
+            loop.call_later, DRAIN_DELAY_SECONDS, server_handler, signum, None
+        )
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+
+async def liveness() -> HealthResponse:
+    """
+    Reports that the process is alive. It never touches the database and never fails
+    because of the query engine (pool statistics are best effort), so a slow or
+    unreachable database does not get the worker restarted.
+
+    Returns:
+        HealthResponse: The current readiness, pool statistics and the last DB ping.
+
+    Example:
+        await liveness()
+        > HealthResponse(status="ok", ready=True, pools=[PoolStats(backend="prisma", ...)], ...)
+    """
+    return HealthResponse(
+        status="ok",
+        ready=_ready,
+        pools=await get_pool_stats(),
+        last_ping_latency_ms=_last_ping_latency_ms,
+        last_ping_at=_last_ping_at,
+    )
+
+
+async def readiness() -> HealthResponse:
+    """
+    Reports whether the worker should receive traffic. It is ready once prewarm() has
+    completed and the database answers a ping, and stops being ready for good once
+    SIGTERM has been received. If the startup prewarm failed, it is retried here; probes
+    that arrive while a prewarm is already running get "unavailable" instead of
+    starting another one.
+
+    Returns:
+        HealthResponse: status "ok" when ready, "unavailable" otherwise.
+
+    Example:
+        await readiness()
+        > HealthResponse(status="ok", ready=True, pools=[PoolStats(backend="prisma", ...)], ...)
+    """
+    ready = False
+    try:
+        if _ready and not _draining:
+            await ping_database()
+            ready = _ready
+        elif not _draining and not _prewarm_lock.locked():
+            await prewarm()
+            ready = _ready
+    except Exception:
+        logger.exception("Database readiness check failed")
+    return HealthResponse(
+        status="ok" if ready else "unavailable",
+        ready=ready,
+        pools=await get_pool_stats(),
+        last_ping_latency_ms=_last_ping_latency_ms,
+        last_ping_at=_last_ping_at,
+    )
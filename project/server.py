@@ -4,16 +4,19 @@ from contextlib import asynccontextmanager
 import project.api_documentation_service
 import project.CreateHelloWorldMessage_service
 import project.DeleteHelloWorldMessage_service
+import project.fast_read_service
 import project.get_api_documentation_service
 import project.get_hello_world_service
 import project.getHelloWorld_service
 import project.getHelloWorldMessage_service
+import project.health_service
 import project.hello_world_service
 import project.HelloWorldEndpoint_service
 import project.UpdateHelloWorldMessage_service
-from fastapi import FastAPI
+import project.user_activity_service
+from fastapi import FastAPI, HTTPException
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response
 from prisma import Prisma
 
 logger = logging.getLogger(__name__)
@@ -24,7 +27,14 @@ db_client = Prisma(auto_register=True)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await db_client.connect()
+    await project.fast_read_service.connect()
+    try:
+        await project.health_service.prewarm()
+    except Exception:
+        logger.exception("Prewarm failed, /readyz will retry it")
+    project.health_service.install_drain_handler()
     yield
+    await project.fast_read_service.disconnect()
     await db_client.disconnect()
 
 
@@ -35,6 +45,25 @@ app = FastAPI(
 )
 
 
+@app.get("/healthz", response_model=project.health_service.HealthResponse)
+async def api_get_healthz() -> project.health_service.HealthResponse:
+    """
+    Liveness probe. It responds as long as the worker is running and never touches the database. It reports readiness, pool in-use/idle counts and the latency of the last DB ping.
+    """
+    return await project.health_service.liveness()
+
+
+@app.get("/readyz", response_model=project.health_service.HealthResponse)
+async def api_get_readyz() -> project.health_service.HealthResponse | Response:
+    """
+    Readiness probe. It responds with 200 only once the DB pool is prewarmed, the hot queries (message read, role lookup, documentation read) have run once and the database answers a ping; otherwise, including while the worker drains after SIGTERM, it responds with 503. It reports pool in-use/idle counts and the latency of the last DB ping.
+    """
+    res = await project.health_service.readiness()
+    if not res.ready:
+        return JSONResponse(content=jsonable_encoder(res), status_code=503)
+    return res
+
+
 @app.get(
     "/api/documentation",
     response_model=project.get_api_documentation_service.GetAPIDocumentationResponse,
@@ -275,3 +304,160 @@ async def api_get_api_documentation(
             status_code=500,
             media_type="application/json",
         )
+
+
+@app.post(
+    "/questions",
+    response_model=project.user_activity_service.QuestionResponse,
+)
+async def api_post_create_question(
+    user_id: int,
+    content: str,
+) -> project.user_activity_service.QuestionResponse | Response:
+    """
+    This endpoint creates a question and increments the author's question counter in the same transaction.
+    """
+    try:
+        res = await project.user_activity_service.create_question(user_id, content)
+        return res
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error processing request")
+        res = dict()
+        res["error"] = str(e)
+        return Response(
+            content=jsonable_encoder(res),
+            status_code=500,
+            media_type="application/json",
+        )
+
+
+@app.post(
+    "/questions/{question_id}/answers",
+    response_model=project.user_activity_service.AnswerResponse,
+)
+async def api_post_create_answer(
+    question_id: int,
+    user_id: int,
+    content: str,
+) -> project.user_activity_service.AnswerResponse | Response:
+    """
+    This endpoint creates an answer to a question and increments the author's answer counter in the same transaction.
+    """
+    try:
+        res = await project.user_activity_service.create_answer(
+            question_id, user_id, content
+        )
+        return res
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error processing request")
+        res = dict()
+        res["error"] = str(e)
+        return Response(
+            content=jsonable_encoder(res),
+            status_code=500,
+            media_type="application/json",
+        )
+
+
+@app.delete(
+    "/questions/{question_id}",
+    response_model=project.user_activity_service.DeleteActivityResponse,
+)
+async def api_delete_question(
+    question_id: int,
+) -> project.user_activity_service.DeleteActivityResponse | Response:
+    """
+    This endpoint deletes a question and its answers, and decrements the counters of all affected users in the same transaction.
+    """
+    try:
+        res = await project.user_activity_service.delete_question(question_id)
+        return res
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error processing request")
+        res = dict()
+        res["error"] = str(e)
+        return Response(
+            content=jsonable_encoder(res),
+            status_code=500,
+            media_type="application/json",
+        )
+
+
+@app.delete(
+    "/answers/{answer_id}",
+    response_model=project.user_activity_service.DeleteActivityResponse,
+)
+async def api_delete_answer(
+    answer_id: int,
+) -> project.user_activity_service.DeleteActivityResponse | Response:
+    """
+    This endpoint deletes an answer and decrements the author's answer counter in the same transaction.
+    """
+    try:
+        res = await project.user_activity_service.delete_answer(answer_id)
+        return res
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error processing request")
+        res = dict()
+        res["error"] = str(e)
+        return Response(
+            content=jsonable_encoder(res),
+            status_code=500,
+            media_type="application/json",
+        )
+
+
+@app.get(
+    "/users/{user_id}/activity",
+    response_model=project.user_activity_service.UserActivityResponse,
+)
+async def api_get_user_activity(
+    user_id: int,
+) -> project.user_activity_service.UserActivityResponse | Response:
+    """
+    This endpoint returns the question and answer counters and the last-activity timestamp of a user. It is a primary-key lookup on the UserActivity summary table and never scans the Question or Answer tables.
+    """
+    try:
+        res = await project.user_activity_service.get_user_activity(user_id)
+        return res
+    except Exception as e:
+        logger.exception("Error processing request")
+        res = dict()
+        res["error"] = str(e)
+        return Response(
+            content=jsonable_encoder(res),
+            status_code=500,
+            media_type="application/json",
+        )
+
+
+@app.get(
+    "/users/activity/leaderboard",
+    response_model=project.user_activity_service.LeaderboardResponse,
+)
+async def api_get_activity_leaderboard(
+    limit: int = 10,
+) -> project.user_activity_service.LeaderboardResponse | Response:
+    """
+    This endpoint returns the top-N most active users by combined question and answer count. It reads only `limit` rows through the UserActivity leaderboard index.
+    """
+    try:
+        res = await project.user_activity_service.get_activity_leaderboard(limit)
+        return res
+    except Exception as e:
+        logger.exception("Error processing request")
+        res = dict()
+        res["error"] = str(e)
+        return Response(
+            content=jsonable_encoder(res),
+            status_code=500,
+            media_type="application/json",
+        )
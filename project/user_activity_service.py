@@ -0,0 +1,399 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import prisma
+import prisma.errors
+import prisma.models
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+LEADERBOARD_MAX_LIMIT = 100
+
+# rebuild_user_activity() scans both tables, far beyond Prisma's 5 s transaction default.
+REBUILD_MAX_WAIT = timedelta(seconds=10)
+REBUILD_TIMEOUT = timedelta(minutes=10)
+
+
+class QuestionResponse(BaseModel):
+    """
+    Response model for a created question.
+    """
+
+    id: int
+    userId: int
+    content: str
+    createdAt: datetime
+
+
+class AnswerResponse(BaseModel):
+    """
+    Response model for a created answer.
+    """
+
+    id: int
+    questionId: int
+    userId: int
+    content: str
+    createdAt: datetime
+
+
+class DeleteActivityResponse(BaseModel):
+    """
+    Response model for the deletion of a question or an answer.
+    """
+
+    message: str
+
+
+class UserActivityResponse(BaseModel):
+    """
+    Per-user question and answer counters, read from the UserActivity summary table.
+    """
+
+    userId: int
+    questionCount: int
+    answerCount: int
+    totalCount: int
+    lastActivityAt: Optional[datetime] = None
+
+
+class LeaderboardResponse(BaseModel):
+    """
+    The top-N most active users, ordered by their combined question and answer count.
+    """
+
+    users: List[UserActivityResponse]
+
+
+async def bump_user_activity(
+    transaction: prisma.Prisma,
+    user_id: int,
+    questions: int = 0,
+    answers: int = 0,
+    last_activity_at: Optional[datetime] = None,
+) -> None:
+    """
+    Applies a delta to a user's activity counters inside the given transaction.
+
+    The summary row is created on first use, so callers never have to check for it.
+    The whole change is a single INSERT ... ON CONFLICT, so concurrent writers for the
+    same user neither race on creating the row nor lose increments. lastActivityAt only
+    ever moves forward here, so a transaction that commits late cannot replace a newer
+    timestamp with an older one.
+
+    Args:
+        transaction (prisma.Prisma): The transaction client the delta is applied with.
+        user_id (int): The ID of the user whose counters change.
+        questions (int): The change in the number of questions asked by the user.
+        answers (int): The change in the number of answers given by the user.
+        last_activity_at (Optional[datetime]): The creation time of a new question or answer, if any.
+
+    Example:
+        async with prisma.get_client().tx() as transaction:
+            await bump_user_activity(transaction, 5, questions=1, last_activity_at=datetime.now(timezone.utc))
+    """
+    await transaction.execute_raw(
+        """
+        INSERT INTO "UserActivity"
+            ("userId", "questionCount", "answerCount", "totalCount", "lastActivityAt")
+        VALUES (
+            $1::int,
+            GREATEST($2::int, 0),
+            GREATEST($3::int, 0),
+            GREATEST($2::int, 0) + GREATEST($3::int, 0),
+            $4::timestamptz AT TIME ZONE 'UTC'
+        )
+        ON CONFLICT ("userId") DO UPDATE SET
+            "questionCount" = "UserActivity"."questionCount" + $2::int,
+            "answerCount" = "UserActivity"."answerCount" + $3::int,
+            "totalCount" = "UserActivity"."totalCount" + $2::int + $3::int,
+            "lastActivityAt" = GREATEST(
+                "UserActivity"."lastActivityAt", EXCLUDED."lastActivityAt"
+            )
+        """,
+        user_id,
+        questions,
+        answers,
+        last_activity_at,
+    )
+
+
+async def refresh_last_activity(transaction: prisma.Prisma, user_id: int) -> None:
+    """
+    Recomputes a user's lastActivityAt from their remaining questions and answers.
+
+    lastActivityAt is the creation time of the user's newest existing question or
+    answer, the same value rebuild_user_activity() computes, so it is refreshed after
+    deletes. Both lookups use the (userId, createdAt) indexes.
+
+    Args:
+        transaction (prisma.Prisma): The transaction client the refresh runs in.
+        user_id (int): The ID of the user whose timestamp is refreshed.
+
+    Example:
+        async with prisma.get_client().tx() as transaction:
+            await refresh_last_activity(transaction, 5)
+    """
+    await transaction.execute_raw(
+        """
+        UPDATE "UserActivity" SET "lastActivityAt" = GREATEST(
+            (SELECT MAX("createdAt") FROM "Question" WHERE "userId" = $1::int),
+            (SELECT MAX("createdAt") FROM "Answer" WHERE "userId" = $1::int)
+        )
+        WHERE "userId" = $1::int
+        """,
+        user_id,
+    )
+
+
+async def create_question(user_id: int, content: str) -> QuestionResponse:
+    """
+    Creates a question and increments the author's question counter in the same transaction.
+
+    Args:
+        user_id (int): The ID of the user asking the question.
+        content (str): The text of the question.
+
+    Returns:
+        QuestionResponse: The created question.
+
+    Example:
+        await create_question(5, "How do I say hello?")
+        > QuestionResponse(id=1, userId=5, content="How do I say hello?", createdAt=...)
+    """
+    async with prisma.get_client().tx() as transaction:
+        try:
+            question = await prisma.models.Question.prisma(transaction).create(
+                data={"userId": user_id, "content": content}
+            )
+        except prisma.errors.ForeignKeyViolationError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
+            )
+        await bump_user_activity(
+            transaction, user_id, questions=1, last_activity_at=question.createdAt
+        )
+    return QuestionResponse(
+        id=question.id,
+        userId=question.userId,
+        content=question.content,
+        createdAt=question.createdAt,
+    )
+
+
+async def create_answer(question_id: int, user_id: int, content: str) -> AnswerResponse:
+    """
+    Creates an answer and increments the author's answer counter in the same transaction.
+
+    Args:
+        question_id (int): The ID of the question being answered.
+        user_id (int): The ID of the user answering the question.
+        content (str): The text of the answer.
+
+    Returns:
+        AnswerResponse: The created answer.
+
+    Example:
+        await create_answer(1, 7, "Just say 'hello world'.")
+        > AnswerResponse(id=1, questionId=1, userId=7, content="Just say 'hello world'.", createdAt=...)
+    """
+    async with prisma.get_client().tx() as transaction:
+        try:
+            answer = await prisma.models.Answer.prisma(transaction).create(
+                data={"questionId": question_id, "userId": user_id, "content": content}
+            )
+        except prisma.errors.ForeignKeyViolationError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Question or user not found.",
+            )
+        await bump_user_activity(
+            transaction, user_id, answers=1, last_activity_at=answer.createdAt
+        )
+    return AnswerResponse(
+        id=answer.id,
+        questionId=answer.questionId,
+        userId=answer.userId,
+        content=answer.content,
+        createdAt=answer.createdAt,
+    )
+
+
+async def delete_answer(answer_id: int) -> DeleteActivityResponse:
+    """
+    Deletes an answer and decrements the author's answer counter in the same transaction.
+
+    Args:
+        answer_id (int): The ID of the answer to delete.
+
+    Returns:
+        DeleteActivityResponse: Acknowledges the deletion.
+
+    Example:
+        await delete_answer(1)
+        > DeleteActivityResponse(message="Answer 1 has been deleted.")
+    """
+    async with prisma.get_client().tx() as transaction:
+        answer = await prisma.models.Answer.prisma(transaction).delete(
+            where={"id": answer_id}
+        )
+        if answer is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Answer not found."
+            )
+        await bump_user_activity(transaction, answer.userId, answers=-1)
+        await refresh_last_activity(transaction, answer.userId)
+    return DeleteActivityResponse(message=f"Answer {answer_id} has been deleted.")
+
+
+async def delete_question(question_id: int) -> DeleteActivityResponse:
+    """
+    Deletes a question together with its answers, and decrements the counters of the
+    question author and of every answer author in the same transaction.
+
+    Args:
+        question_id (int): The ID of the question to delete.
+
+    Returns:
+        DeleteActivityResponse: Acknowledges the deletion.
+
+    Example:
+        await delete_question(1)
+        > DeleteActivityResponse(message="Question 1 has been deleted.")
+    """
+    async with prisma.get_client().tx() as transaction:
+        # RETURNING reports exactly the rows this statement deleted, so an answer
+        # committed concurrently is either deleted and counted here or not deleted.
+        answers = await transaction.query_raw(
+            'DELETE FROM "Answer" WHERE "questionId" = $1::int RETURNING "userId"',
+            question_id,
+        )
+        question = await prisma.models.Question.prisma(transaction).delete(
+            where={"id": question_id}
+        )
+        if question is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Question not found."
+            )
+        for user_id, count in Counter(answer["userId"] for answer in answers).items():
+            await bump_user_activity(transaction, user_id, answers=-count)
+            await refresh_last_activity(transaction, user_id)
+        await bump_user_activity(transaction, question.userId, questions=-1)
+        await refresh_last_activity(transaction, question.userId)
+    return DeleteActivityResponse(message=f"Question {question_id} has been deleted.")
+
+
+async def get_user_activity(user_id: int) -> UserActivityResponse:
+    """
+    Returns the activity counters of a single user with a primary-key lookup.
+
+    Users without any recorded activity get zeroed counters.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        UserActivityResponse: The user's question and answer counters.
+
+    Example:
+        await get_user_activity(5)
+        > UserActivityResponse(userId=5, questionCount=3, answerCount=2, totalCount=5, lastActivityAt=...)
+    """
+    activity = await prisma.models.UserActivity.prisma().find_unique(
+        where={"userId": user_id}
+    )
+    if activity is None:
+        return UserActivityResponse(
+            userId=user_id, questionCount=0, answerCount=0, totalCount=0
+        )
+    return UserActivityResponse(
+        userId=activity.userId,
+        questionCount=activity.questionCount,
+        answerCount=activity.answerCount,
+        totalCount=activity.totalCount,
+        lastActivityAt=activity.lastActivityAt,
+    )
+
+
+async def get_activity_leaderboard(limit: int = 10) -> LeaderboardResponse:
+    """
+    Returns the top-N most active users. The query is served by the
+    (totalCount DESC, userId) index, so it reads only `limit` rows.
+
+    Args:
+        limit (int): The number of users to return, capped at LEADERBOARD_MAX_LIMIT.
+
+    Returns:
+        LeaderboardResponse: The most active users, most active first.
+
+    Example:
+        await get_activity_leaderboard(3)
+        > LeaderboardResponse(users=[UserActivityResponse(userId=5, ...), ...])
+    """
+    limit = max(1, min(limit, LEADERBOARD_MAX_LIMIT))
+    activities = await prisma.models.UserActivity.prisma().find_many(
+        order=[{"totalCount": "desc"}, {"userId": "asc"}], take=limit
+    )
+    return LeaderboardResponse(
+        users=[
+            UserActivityResponse(
+                userId=activity.userId,
+                questionCount=activity.questionCount,
+                answerCount=activity.answerCount,
+                totalCount=activity.totalCount,
+                lastActivityAt=activity.lastActivityAt,
+            )
+            for activity in activities
+        ]
+    )
+
+
+async def rebuild_user_activity() -> None:
+    """
+    Recomputes the whole UserActivity table from Question and Answer.
+
+    This scans both tables and is only meant for the initial backfill or for repairing
+    drift, e.g. after rows were written outside of this module. Question and Answer are
+    locked in SHARE mode for the duration, so no write can land between the aggregation
+    and the rewrite of the summary table; concurrent writers wait for the rebuild.
+
+    Example:
+        await rebuild_user_activity()
+    """
+    async with prisma.get_client().tx(
+        max_wait=REBUILD_MAX_WAIT, timeout=REBUILD_TIMEOUT
+    ) as transaction:
+        await transaction.execute_raw('LOCK TABLE "Question", "Answer" IN SHARE MODE')
+        question_groups = await prisma.models.Question.prisma(transaction).group_by(
+            by=["userId"], count=True, max={"createdAt": True}
+        )
+        answer_groups = await prisma.models.Answer.prisma(transaction).group_by(
+            by=["userId"], count=True, max={"createdAt": True}
+        )
+        rows: Dict[int, Dict] = {}
+        for field, groups in (
+            ("questionCount", question_groups),
+            ("answerCount", answer_groups),
+        ):
+            for group in groups:
+                row = rows.setdefault(
+                    group["userId"],
+                    {
+                        "userId": group["userId"],
+                        "questionCount": 0,
+                        "answerCount": 0,
+                        "lastActivityAt": None,
+                    },
+                )
+                row[field] = group["_count"]["_all"]
+                last = group["_max"]["createdAt"]
+                if row["lastActivityAt"] is None or last > row["lastActivityAt"]:
+                    row["lastActivityAt"] = last
+        for row in rows.values():
+            row["totalCount"] = row["questionCount"] + row["answerCount"]
+        await prisma.models.UserActivity.prisma(transaction).delete_many()
+        if rows:
+            await prisma.models.UserActivity.prisma(transaction).create_many(
+                data=list(rows.values())
+            )
@@ -0,0 +1,54 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from project.fast_read_service import asyncpg_connect_args
+
+
+def test_plain_url_is_unchanged():
+    dsn, options = asyncpg_connect_args("postgresql://u:p@localhost:5432/db")
+    assert dsn == "postgresql://u:p@localhost:5432/db"
+    assert options == {}
+
+
+def test_schema_becomes_search_path():
+    dsn, options = asyncpg_connect_args(
+        "postgresql://u:p@localhost:5432/db?schema=public"
+    )
+    assert dsn == "postgresql://u:p@localhost:5432/db"
+    assert options == {"server_settings": {"search_path": "public"}}
+
+
+@pytest.mark.parametrize("value", ["true", "TRUE"])
+def test_pgbouncer_disables_statement_cache(value):
+    dsn, options = asyncpg_connect_args(
+        f"postgresql://u:p@pgbouncer:6432/db?pgbouncer={value}"
+    )
+    assert dsn == "postgresql://u:p@pgbouncer:6432/db"
+    assert options == {"statement_cache_size": 0}
+
+
+def test_pgbouncer_false_keeps_statement_cache():
+    _, options = asyncpg_connect_args("postgresql://u:p@h/db?pgbouncer=false")
+    assert "statement_cache_size" not in options
+
+
+def test_prisma_only_params_are_stripped_and_others_kept():
+    dsn, _ = asyncpg_connect_args(
+        "postgresql://u:p@h:5432/db?connection_limit=5&pool_timeout=10"
+        "&socket_timeout=3&connect_timeout=5&statement_cache_size=100"
+        "&sslaccept=strict&sslidentity=id.p12&sslpassword=secret&sslmode=require"
+    )
+    assert parse_qs(urlsplit(dsn).query) == {"sslmode": ["require"]}
+
+
+def test_cloud_run_socket_host_is_passed_explicitly():
+    dsn, options = asyncpg_connect_args(
+        "postgresql://u:p@localhost/db?host=/cloudsql/proj:us-central1:instance"
+    )
+    assert dsn == "postgresql://u:p@localhost/db"
+    assert options == {"host": "/cloudsql/proj:us-central1:instance"}
+
+
+def test_percent_encoded_credentials_are_preserved():
+    dsn, _ = asyncpg_connect_args("postgresql://u:p%40ss@h:5432/db?schema=app")
+    assert dsn == "postgresql://u:p%40ss@h:5432/db"